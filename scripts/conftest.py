@@ -0,0 +1,2 @@
+# test_mysql.py is the seeder script itself, not a test module
+collect_ignore = ["test_mysql.py"]
@@ -0,0 +1,85 @@
+"""
+SQL script splitting for the MySQL seeder
+Breaks migration files into statements the server can execute
+"""
+
+
+def _is_delimiter_command(line, i):
+    """Whether a DELIMITER client command starts at line[i]"""
+    end = i + len('DELIMITER')
+    return (line[i:end].upper() == 'DELIMITER'
+            and (end == len(line) or line[end].isspace()))
+
+
+def iter_statements(lines):
+    """Yield complete SQL statements from an iterable of lines
+
+    Tracks quotes, comments and DELIMITER changes so semicolons inside
+    strings or procedure bodies do not split a statement. Comments and the
+    trailing "SELECT 'Migrations ..." sentinel are dropped; /*! */
+    executable comments and /*+ */ optimizer hints are kept.
+    """
+    delimiter = ';'
+    buf = []
+    has_content = False
+    quote = None
+    in_comment = False
+
+    def flush():
+        statement = ''.join(buf).strip()
+        buf.clear()
+        if statement and not statement.startswith("SELECT 'Migrations"):
+            return statement
+        return None
+
+    for line in lines:
+        i, n = 0, len(line)
+        while i < n:
+            c = line[i]
+            if in_comment:
+                end = line.find('*/', i)
+                if end == -1:
+                    break
+                in_comment = False
+                # Keep the tokens around the comment apart
+                buf.append(' ')
+                i = end + 2
+            elif quote:
+                buf.append(c)
+                if c == '\\' and quote != '`' and i + 1 < n:
+                    buf.append(line[i + 1])
+                    i += 1
+                elif c == quote:
+                    quote = None
+                i += 1
+            elif not has_content and _is_delimiter_command(line, i):
+                # DELIMITER is a client command: it takes the rest of the line
+                args = line[i + len('DELIMITER'):].split()
+                if args:
+                    delimiter = args[0]
+                buf.clear()
+                break
+            elif line.startswith(delimiter, i):
+                statement = flush()
+                has_content = False
+                if statement:
+                    yield statement
+                i += len(delimiter)
+            elif c == '#' or (line.startswith('--', i) and (i + 2 == n or line[i + 2].isspace())):
+                buf.append('\n')
+                break
+            elif line.startswith('/*', i) and not line.startswith(('/*!', '/*+'), i):
+                # Executable comments and optimizer hints are kept
+                in_comment = True
+                i += 2
+            else:
+                if c in '\'"`':
+                    quote = c
+                if not c.isspace():
+                    has_content = True
+                buf.append(c)
+                i += 1
+
+    statement = flush()
+    if statement:
+        yield statement
@@ -1,13 +1,77 @@
 """
 Simple MySQL Connection Test & Data Seeder
 Runs migrations and inserts sample data
+
+Requires mysql-connector-python 9.2 or newer
 """
 
-import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
+from mysql.connector.pooling import MySQLConnectionPool
+import atexit
+import csv
+import shutil
+import tempfile
 import uuid
 import os
-import re
+import sys
+from urllib.parse import unquote, urlparse
+
+from sql_statements import iter_statements
+
+# Above this many rows, seed through LOAD DATA LOCAL INFILE instead of INSERT
+COPY_THRESHOLD = 100
+
+ORGANIZATION_SQL = "INSERT INTO organizations (id, name, domain, status) VALUES (%s, %s, %s, 'active')"
+TENANT_SQL = "INSERT INTO tenants (id, organization_id, name, slug, status) VALUES (%s, %s, %s, %s, 'active')"
+USERS_SQL = "INSERT INTO users (id, email, password_hash, status) VALUES (%s, %s, %s, %s)"
+USER_TENANTS_SQL = "INSERT INTO user_tenants (user_id, tenant_id, status) VALUES (%s, %s, %s)"
+USER_COLUMNS = ("id", "email", "password_hash", "status")
+USER_TENANT_COLUMNS = ("user_id", "tenant_id", "status")
+
+# Approximate SQL payload sent per multi-statement round-trip
+MIGRATION_BATCH_BYTES = 256 * 1024
+
+# Read buffer for the migration file, so it is pulled in with few syscalls
+MIGRATION_READ_BUFFER = 64 * 1024
+
+# Connections held by the seeding pool; concurrent seeders can raise this
+# towards the usual cpu_count * 2 + 1
+POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '1'))
+
+_spool_dir = None
+
+
+def get_spool_dir():
+    """Return this process's private LOAD DATA spool directory
+
+    mkdtemp() creates it with mode 0700, and it is the only path the
+    server may request through LOAD DATA LOCAL. Removed at exit.
+    """
+    global _spool_dir
+    if _spool_dir is None:
+        _spool_dir = tempfile.mkdtemp(prefix='seed-')
+        atexit.register(shutil.rmtree, _spool_dir, ignore_errors=True)
+    return _spool_dir
+
+
+# One pool per distinct connection config
+_pools = {}
+
+
+def get_pool(config):
+    """Return the pool for config, creating it on first use"""
+    key = tuple(sorted(config.items()))
+    pool = _pools.get(key)
+    if pool is None:
+        pool = MySQLConnectionPool(
+            pool_name=f"seed_{len(_pools)}",
+            pool_size=POOL_SIZE,
+            pool_reset_session=False,
+            **config
+        )
+        _pools[key] = pool
+    return pool
+
 
 def main():
     print("=" * 50)
@@ -20,29 +84,55 @@ def main():
         'host': os.getenv('DB_HOST', 'localhost'),
         'database': os.getenv('DB_NAME', 'auth_platform'),
         'user': os.getenv('DB_USER', 'root'),
-        'password': os.getenv('DB_PASSWORD')
+        'password': os.getenv('DB_PASSWORD'),
+        # LOAD DATA LOCAL may only upload files from the private spool dir
+        'allow_local_infile_in_path': get_spool_dir(),
+        'autocommit': False
     }
 
     # Try to parse from AUTH__DATABASE__MYSQL_URL if provided
     mysql_url = os.getenv('AUTH__DATABASE__MYSQL_URL')
     if mysql_url:
-        match = re.match(r"mysql://(.*?):(.*?)@(.*?)/(.*)", mysql_url)
-        if match:
-            config['user'] = match.group(1)
-            config['password'] = match.group(2)
-            config['host'] = match.group(3)
-            config['database'] = match.group(4)
+        url = urlparse(mysql_url)
+        if url.scheme == 'mysql' and url.hostname:
+            try:
+                port = url.port
+            except ValueError:
+                print("❌ Error: AUTH__DATABASE__MYSQL_URL has an invalid port")
+                return
+
+            # Keep DB_USER/DB_PASSWORD unless the URL carries credentials
+            if url.username is not None:
+                config['user'] = unquote(url.username)
+            if url.password is not None:
+                config['password'] = unquote(url.password)
+            config['host'] = url.hostname
+            if url.path.strip('/'):
+                config['database'] = unquote(url.path.strip('/'))
+            if port:
+                config['port'] = port
+
+    # Only use a Unix socket when asked to: guessing one for localhost could
+    # reach a different server than the configured host/port. Compress over
+    # the network where bandwidth rather than latency dominates
+    socket_path = os.getenv('DB_SOCKET')
+    if socket_path:
+        config['unix_socket'] = socket_path
+    elif config['host'] not in ('localhost', '127.0.0.1'):
+        config['compress'] = True
 
     if not config['password']:
         print("❌ Error: DB_PASSWORD environment variable is not set")
         return
 
+    connection = None
+    cursor = None
     try:
         print("📡 Connecting to MySQL...")
-        print(f"   Host: {config['host']}")
+        print(f"   Host: {config.get('unix_socket', config['host'])}")
         print(f"   Database: {config['database']}\n")
 
-        connection = mysql.connector.connect(**config)
+        connection = get_pool(config).get_connection()
 
         if connection.is_connected():
             print("✅ Connection successful!\n")
@@ -75,28 +165,33 @@ def main():
         print(f"❌ Error: {e}")
 
     finally:
-        if connection and connection.is_connected():
-            cursor.close()
+        if connection is not None:
+            if cursor is not None:
+                cursor.close()
+            # Sessions are not reset on return, so end the open transaction
+            if connection.is_connected():
+                connection.rollback()
+            # Hands the connection back to the pool rather than closing it
             connection.close()
-            print("\n📡 Connection closed")
+            print("\n📡 Connection returned to pool")
 
 
 def run_migrations(connection, cursor):
     """Run database migrations from file"""
     try:
-        with open('../migrations/complete_migration.sql', 'r', encoding='utf-8') as f:
-            sql = f.read()
-
-        # Split and execute statements
-        for statement in sql.split(';'):
-            statement = statement.strip()
-            if statement and not statement.startswith('--') and not statement.startswith('/*'):
-                if "SELECT 'Migrations" not in statement:
-                    try:
-                        cursor.execute(statement)
-                    except Error as e:
-                        if "already exists" not in str(e):
-                            print(f"   Warning: {e}")
+        with open('../migrations/complete_migration.sql', 'r', encoding='utf-8',
+                  buffering=MIGRATION_READ_BUFFER) as f:
+            batch = []
+            batch_bytes = 0
+            for statement in iter_statements(f):
+                batch.append(statement)
+                batch_bytes += len(statement)
+                if batch_bytes >= MIGRATION_BATCH_BYTES:
+                    execute_batch(cursor, batch)
+                    batch = []
+                    batch_bytes = 0
+            if batch:
+                execute_batch(cursor, batch)
 
         connection.commit()
         print("   ✅ Migrations completed")
@@ -105,6 +200,27 @@ def run_migrations(connection, cursor):
         print("   ⚠️  Migration file not found, skipping")
 
 
+def execute_batch(cursor, statements):
+    """Execute statements in one multi-statement round-trip"""
+    while statements:
+        done = 0
+        try:
+            # mysql-connector >= 9.2 sends the whole script with execute() and
+            # exposes the remaining result sets through nextset()
+            cursor.execute(";\n".join(statements))
+            while True:
+                if cursor.with_rows:
+                    cursor.fetchall()
+                done += 1
+                if not cursor.nextset():
+                    return
+        except Error as e:
+            if "already exists" not in str(e):
+                print(f"   Warning: {e}")
+            # The server stops at the first failing statement; resume after it
+            statements = statements[done + 1:]
+
+
 def insert_sample_data(connection, cursor):
     """Insert sample data into tables"""
     # Check if data exists
@@ -116,62 +232,116 @@ def insert_sample_data(connection, cursor):
         return
 
     # Generate UUIDs
-    org_id = str(uuid.uuid4()).replace('-', '')
-    tenant_id = str(uuid.uuid4()).replace('-', '')
-    user1_id = str(uuid.uuid4()).replace('-', '')
-    user2_id = str(uuid.uuid4()).replace('-', '')
-
-    # Insert organization
-    print("   Creating organization...")
-    cursor.execute(
-        "INSERT INTO organizations (id, name, domain, status) VALUES (%s, %s, %s, 'active')",
-        (org_id, "Acme Corporation", "acme.com")
-    )
-
-    # Insert tenant
-    print("   Creating tenant...")
-    cursor.execute(
-        "INSERT INTO tenants (id, organization_id, name, slug, status) VALUES (%s, %s, %s, %s, 'active')",
-        (tenant_id, org_id, "Acme Production", "acme-prod")
-    )
-
-    # Insert users
-    print("   Creating users...")
-    password_hash = "$argon2id$v=19$m=19456,t=2,p=1$test$hash"
-
-    for user_id, email in [(user1_id, "admin@acme.com"), (user2_id, "user@acme.com")]:
+    org_id = uuid.uuid4().hex
+    tenant_id = uuid.uuid4().hex
+    user1_id = uuid.uuid4().hex
+    user2_id = uuid.uuid4().hex
+
+    # Seed in a single transaction with constraint checks deferred, so
+    # index maintenance and the fsync happen once at commit
+    cursor.execute("SET unique_checks = 0, foreign_key_checks = 0")
+    try:
+        # Insert organization
+        print("   Creating organization...")
         cursor.execute(
-            "INSERT INTO users (id, email, password_hash, status) VALUES (%s, %s, %s, 'active')",
-            (user_id, email, password_hash)
+            ORGANIZATION_SQL,
+            (org_id, "Acme Corporation", "acme.com")
         )
 
+        # Insert tenant
+        print("   Creating tenant...")
         cursor.execute(
-            "INSERT INTO user_tenants (user_id, tenant_id, status) VALUES (%s, %s, 'active')",
-            (user_id, tenant_id)
+            TENANT_SQL,
+            (tenant_id, org_id, "Acme Production", "acme-prod")
         )
 
-    connection.commit()
+        # Insert users
+        print("   Creating users...")
+        password_hash = "$argon2id$v=19$m=19456,t=2,p=1$test$hash"
+
+        users = [(user1_id, "admin@acme.com"), (user2_id, "user@acme.com")]
+        users_rows = [(user_id, email, password_hash, 'active') for user_id, email in users]
+        ut_rows = [(user_id, tenant_id, 'active') for user_id, _ in users]
+
+        bulk_insert(cursor, USERS_SQL, "users", USER_COLUMNS, users_rows)
+        bulk_insert(cursor, USER_TENANTS_SQL, "user_tenants", USER_TENANT_COLUMNS, ut_rows)
+
+        connection.commit()
+    except Error:
+        if connection.is_connected():
+            connection.rollback()
+        raise
+    finally:
+        # Skip the restore on a dropped connection so the original error
+        # propagates; a live pooled session must get its checks back
+        if connection.is_connected():
+            cursor.execute("SET unique_checks = 1, foreign_key_checks = 1")
+
     print("   ✅ Sample data inserted")
 
 
+def bulk_insert(cursor, insert_sql, table, columns, rows):
+    """Insert rows with insert_sql, or LOAD DATA LOCAL INFILE for large batches"""
+    if len(rows) > COPY_THRESHOLD:
+        try:
+            load_data_infile(cursor, table, columns, rows)
+            return
+        except Error as e:
+            # Servers default to local_infile=OFF; fall back to INSERT
+            if e.errno not in (errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+                               errorcode.ER_NOT_ALLOWED_COMMAND):
+                raise
+            print(f"   LOAD DATA LOCAL unavailable, inserting {table} rows instead")
+
+    # executemany() rewrites a plain INSERT ... VALUES into a single
+    # multi-row statement, so the whole batch costs one round-trip
+    cursor.executemany(insert_sql, rows)
+
+
+def load_data_infile(cursor, table, columns, rows):
+    """Bulk load rows through LOAD DATA LOCAL INFILE"""
+    # mysql-connector can only stream LOAD DATA from a real file, so spool
+    # the rows to a temporary TSV first
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', dir=get_spool_dir(),
+                                     newline='', encoding='utf-8', delete=False) as f:
+        csv.writer(f, delimiter='\t', lineterminator='\n').writerows(rows)
+        # MySQL accepts forward slashes on Windows as well
+        path = f.name.replace('\\', '/').replace("'", "''")
+
+    try:
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY '\\t' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+            "LINES TERMINATED BY '\\n' "
+            f"({', '.join(columns)})"
+        )
+    finally:
+        os.unlink(f.name)
+
+
 def verify_data(cursor):
     """Verify data in tables"""
     tables = ["organizations", "tenants", "users", "user_tenants",
               "roles", "permissions", "refresh_tokens", "revoked_tokens"]
 
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        count = cursor.fetchone()[0]
-        print(f"   {table}: {count} rows")
+    # Collect every count in a single statement and result set
+    cursor.execute(" UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables
+    ))
+
+    lines = [f"   {table}: {count} rows" for table, count in cursor.fetchall()]
 
     # Show sample users
     cursor.execute("SELECT email, status FROM users LIMIT  3")
     users = cursor.fetchall()
 
     if users:
-        print("\n   Sample Users:")
-        for email, status in users:
-            print(f"   - {email} ({status})")
+        lines += ["", "   Sample Users:"]
+        lines += [f"   - {email} ({status})" for email, status in users]
+
+    # Emit the report with a single write instead of one print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+"""
+Tests for the migration statement splitter
+"""
+
+import io
+
+from sql_statements import iter_statements
+
+
+def split(sql):
+    return list(iter_statements(io.StringIO(sql)))
+
+
+def test_splits_on_semicolons():
+    assert split("SELECT 1;\nSELECT 2;\nSELECT 3") == ["SELECT 1", "SELECT 2", "SELECT 3"]
+
+
+def test_semicolons_inside_quotes_do_not_split():
+    sql = """INSERT INTO a VALUES ('x;y', "p;q", 'it''s; ok', 'a\\';b');
+SELECT `odd;name` FROM a;"""
+    assert split(sql) == [
+        """INSERT INTO a VALUES ('x;y', "p;q", 'it''s; ok', 'a\\';b')""",
+        "SELECT `odd;name` FROM a",
+    ]
+
+
+def test_comments_are_dropped():
+    sql = """SELECT 1; -- trailing; comment
+SELECT 2; # hash; comment
+/* block;
+   comment */ SELECT 3;"""
+    assert split(sql) == ["SELECT 1", "SELECT 2", "SELECT 3"]
+
+
+def test_inline_block_comment_separates_tokens():
+    assert split("CREATE TABLE t (id INT/* pk */NOT NULL);") == ["CREATE TABLE t (id INT NOT NULL)"]
+    assert split("SELECT/* c */1;") == ["SELECT 1"]
+
+
+def test_multiline_block_comment_separates_tokens():
+    assert split("SELECT/* spans\nlines */1;") == ["SELECT 1"]
+
+
+def test_double_dash_without_space_is_not_a_comment():
+    assert split("SELECT 1--1;") == ["SELECT 1--1"]
+
+
+def test_executable_comments_are_kept():
+    assert split("/*!40101 SET NAMES utf8mb4 */;") == ["/*!40101 SET NAMES utf8mb4 */"]
+
+
+def test_optimizer_hints_are_kept():
+    assert split("SELECT /*+ MAX_EXECUTION_TIME(1000) */ id FROM t;") == [
+        "SELECT /*+ MAX_EXECUTION_TIME(1000) */ id FROM t"
+    ]
+
+
+def test_comment_only_input_yields_nothing():
+    assert split("-- just a comment\n/* and another */\n") == []
+
+
+def test_statement_preceded_by_comment_is_kept():
+    sql = """-- Organizations
+CREATE TABLE organizations (id CHAR(36));"""
+    assert split(sql) == ["CREATE TABLE organizations (id CHAR(36))"]
+
+
+def test_delimiter_blocks():
+    sql = """DELIMITER //
+CREATE PROCEDURE p() BEGIN SELECT 1; SELECT 2; END //
+DELIMITER ;
+SELECT 3;"""
+    assert split(sql) == [
+        "CREATE PROCEDURE p() BEGIN SELECT 1; SELECT 2; END",
+        "SELECT 3",
+    ]
+
+
+def test_delimiter_after_statement_on_same_line():
+    assert split("SELECT 1;  DELIMITER //\nSELECT 2//") == ["SELECT 1", "SELECT 2"]
+
+
+def test_migrations_sentinel_is_dropped():
+    sql = "CREATE TABLE a (id INT);\nSELECT 'Migrations completed' AS status;"
+    assert split(sql) == ["CREATE TABLE a (id INT)"]